@@ -20,6 +20,7 @@ from collections.abc import Sequence
 import decimal
 import enum
 from functools import lru_cache, partial
+import os
 import struct
 import sys
 import warnings
@@ -33,6 +34,32 @@ from gdb.types import get_basic_type
 # TODO investigate auto-loading: https://sourceware.org/gdb/onlinedocs/gdb/Auto_002dloading-extensions.html#Auto_002dloading-extensions
 
 
+class SummaryParameter(gdb.Parameter):
+    """
+    When on, only print top-level statistics for Arrow ChunkedArray values
+    instead of recursing into each chunk (which can be slow on wide tables).
+
+    This is off by default, unless PYARROW_GDB_SUMMARY=1 is set in gdb's
+    environment.
+    """
+    set_doc = "Set summary-only printing of Arrow chunked arrays."
+    show_doc = "Show summary-only printing of Arrow chunked arrays."
+
+    def __init__(self):
+        super().__init__("arrow-summary", gdb.COMMAND_DATA,
+                         gdb.PARAM_BOOLEAN)
+        self.value = os.environ.get("PYARROW_GDB_SUMMARY") == "1"
+
+    def get_set_string(self):
+        return ""
+
+    def get_show_string(self, svalue):
+        return f"Summary-only printing of Arrow chunked arrays is {svalue}."
+
+
+summary_param = SummaryParameter()
+
+
 _type_ids = [
     'NA', 'BOOL', 'UINT8', 'INT8', 'UINT16', 'INT16', 'UINT32', 'INT32',
     'UINT64', 'INT64', 'HALF_FLOAT', 'FLOAT', 'DOUBLE', 'STRING', 'BINARY',
@@ -62,6 +89,25 @@ def byte_order():
     return sys.byteorder
 
 
+@lru_cache(maxsize=256)
+def lookup_type(name):
+    """
+    Cached version of gdb.lookup_type().
+
+    Type lookups go through the debug information and can be costly,
+    while the same few types are looked up again and again.
+    """
+    return gdb.lookup_type(name)
+
+
+def _on_new_objfile(event):
+    # Newly-loaded debug information may define different types
+    lookup_type.cache_clear()
+
+
+gdb.events.new_objfile.connect(_on_new_objfile)
+
+
 def for_evaluation(val, ty=None):
     """
     Return a parsable form of gdb.Value `val`, optionally with gdb.Type `ty`.
@@ -672,7 +718,7 @@ class RecordBatch:
         # under the hood. What if users create their own RecordBatch
         # implementation?
         self.val = cast_to_concrete(val,
-                                    gdb.lookup_type("arrow::SimpleRecordBatch"))
+                                    lookup_type("arrow::SimpleRecordBatch"))
         self.schema = Schema(deref(self.val['schema_']))
         self.columns = StdPtrVector(self.val['columns_'])
 
@@ -690,7 +736,7 @@ class Table:
         # XXX this relies on Table always being a SimpleTable under the hood.
         # What if users create their own Table implementation?
         self.val = cast_to_concrete(val,
-                                    gdb.lookup_type("arrow::SimpleTable"))
+                                    lookup_type("arrow::SimpleTable"))
         self.schema = Schema(deref(self.val['schema_']))
         self.columns = StdPtrVector(self.val['columns_'])
 
@@ -749,7 +795,7 @@ class TypePrinter:
         self.name = name
         # Cast to concrete type class to access all derived methods
         # and properties.
-        self.type = gdb.lookup_type(f"arrow::{name}")
+        self.type = lookup_type(f"arrow::{name}")
         self.val = cast_to_concrete(val, self.type)
 
     @property
@@ -898,7 +944,7 @@ class UnionTypePrinter(TypePrinter):
 
     def to_string(self):
         type_codes = StdVector(self.val['type_codes_'])
-        type_codes = "{" + ", ".join(str(x.cast(gdb.lookup_type('int')))
+        type_codes = "{" + ", ".join(str(x.cast(lookup_type('int')))
                                      for x in type_codes) + "}"
         return f"{self._format_type()}(fields={self.fields}, type_codes={type_codes})"
 
@@ -932,7 +978,7 @@ class ScalarPrinter:
         self.name = scalar_class_from_type(self.type_name)
         self.type_id = type_id
         # Cast to concrete Scalar class to access derived attributes.
-        concrete_type = gdb.lookup_type(f"arrow::{self.name}")
+        concrete_type = lookup_type(f"arrow::{self.name}")
         self.val = cast_to_concrete(val, concrete_type)
         self.is_valid = bool(self.val['is_valid'])
         return self
@@ -942,7 +988,7 @@ class ScalarPrinter:
         """
         The concrete DataTypeClass instance.
         """
-        concrete_type = gdb.lookup_type(f"arrow::{self.type_name}")
+        concrete_type = lookup_type(f"arrow::{self.type_name}")
         return cast_to_concrete(deref(self.val['type']),
                                 concrete_type)
 
@@ -981,7 +1027,7 @@ class NumericScalarPrinter(ScalarPrinter):
             return (f"{self._format_type()} "
                     f"of value {half_float_value(value)} [{value}]")
         if self.type_name in ("UInt8Type", "Int8Type"):
-            value = value.cast(gdb.lookup_type('int'))
+            value = value.cast(lookup_type('int'))
         return f"{self._format_type()} of value {value}"
 
 
@@ -1161,7 +1207,7 @@ class UnionScalarPrinter(ScalarPrinter):
     """
 
     def to_string(self):
-        type_code = self.val['type_code'].cast(gdb.lookup_type('int'))
+        type_code = self.val['type_code'].cast(lookup_type('int'))
         if not self.is_valid:
             return (f"{self._format_type()} of type {self.type}, "
                     f"type code {type_code}, null value")
@@ -1226,7 +1272,7 @@ class ArrayDataPrinter:
         """
         The concrete DataTypeClass instance.
         """
-        concrete_type = gdb.lookup_type(f"arrow::{self.type_name}")
+        concrete_type = lookup_type(f"arrow::{self.type_name}")
         return cast_to_concrete(deref(self.val['type']), concrete_type)
 
     def _format_contents(self):
@@ -1274,6 +1320,8 @@ class ChunkedArrayPrinter:
         return "array"
 
     def children(self):
+        if summary_param.value:
+            return
         for i, chunk in enumerate(self.chunks):
             printer = ArrayPrinter(deref(chunk))
             yield str(i), printer._format_contents()
@@ -15,9 +15,12 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import contextlib
 from functools import lru_cache
+import hashlib
 import os
 import re
+import selectors
 import shutil
 import subprocess
 import sys
@@ -36,26 +39,71 @@ gdb_script = (os.environ.get('ARROW_GDB_SCRIPT') or
 
 gdb_command = ["gdb", "--nx"]
 
+# Sentinels delimiting each value in GdbSession.print_values()
+# (the begin sentinel is followed by the value index)
+_VALUE_BEGIN = "__A__"
+_VALUE_END = "__B__"
+_VALUE_BLOCK_RE = re.compile(
+    f"{_VALUE_BEGIN} (\\d+)\n(.*?){_VALUE_END}\n", re.S)
+
+_PRINT_PREFIX_RE = re.compile(r"^\$\d+ = ")
+
+
+@lru_cache()
+def _frame_re(func_name):
+    return re.compile(r"(?mi)^#(\d+)\s+.* in " + re.escape(func_name) + " ")
+
 
 @lru_cache()
 def is_gdb_available():
-    try:
-        proc = subprocess.run(gdb_command + ["--version"],
-                              stdin=subprocess.DEVNULL,
-                              stdout=subprocess.PIPE,
-                              stderr=subprocess.STDOUT)
-    except FileNotFoundError:
-        return False
-    return proc.returncode == 0
+    return shutil.which(gdb_command[0]) is not None
+
+
+def _which_cache_file(cmd):
+    # The lookup result only depends on $PATH
+    key = hashlib.blake2b(os.environ.get("PATH", "").encode(),
+                          digest_size=16).hexdigest()
+    cache_dir = (os.environ.get("XDG_CACHE_HOME") or
+                 os.path.join(os.path.expanduser("~"), ".cache"))
+    return os.path.join(cache_dir, "arrow-gdb-tests", f"which-{cmd}-{key}")
 
 
 @lru_cache()
 def python_executable():
+    # Also cache the lookup on disk, for repeated pytest invocations
+    cache_file = _which_cache_file("python3")
+    try:
+        with open(cache_file) as f:
+            path = f.read()
+        if os.path.isfile(path) and os.access(path, os.X_OK):
+            return path
+    except OSError:
+        pass
+
     path = shutil.which("python3")
     assert path is not None, "Couldn't find python3 executable"
+    # Several processes (e.g. pytest-xdist workers) may write the cache
+    # concurrently, so write to a private file and rename it atomically.
+    tmp_file = f"{cache_file}.{os.getpid()}"
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(tmp_file, "w") as f:
+            f.write(path)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # Don't leave a stray temporary file in the cache directory
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
     return path
 
 
+@lru_cache()
+def is_gdb_script_available():
+    return os.path.exists(gdb_script)
+
+
 def skip_if_gdb_unavailable():
     if not is_gdb_available():
         pytest.skip("gdb command unavailable")
@@ -63,50 +111,96 @@ def skip_if_gdb_unavailable():
 
 class GdbSession:
     proc = None
-    verbose = True
+    # Set ARROW_GDB_VERBOSE=1 to echo the gdb session to stdout
+    verbose = os.environ.get("ARROW_GDB_VERBOSE") == "1"
+    # Maximum time to wait for gdb to output something, in seconds
+    timeout = 300
 
     def __init__(self, *args, **env):
         # Let stderr through to let pytest display it separately on errors
         self.proc = subprocess.Popen(gdb_command + list(args),
-                                     env=env, bufsize=0,
+                                     env=env, bufsize=-1,
                                      stdin=subprocess.PIPE,
                                      stdout=subprocess.PIPE)
-        self.last_stdout = []
-        self.last_stdout_line = b""
+        # Read gdb output directly from the raw file, bypassing the
+        # BufferedReader, into a preallocated chunk
+        self._stdout_raw = self.proc.stdout.raw
+        self._chunk = memoryview(bytearray(65536))
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._stdout_raw, selectors.EVENT_READ)
+        self._buf = bytearray()
+        # Pending session transcript, when verbose
+        self._echo = bytearray()
+
+    def _flush_echo(self):
+        if self._echo:
+            sys.stdout.buffer.write(self._echo)
+            sys.stdout.buffer.flush()
+            del self._echo[:]
 
-    def wait_until_ready(self):
+    def _find_prompt(self, start):
         """
-        Record output until the gdb prompt displays.  Return recorded output.
+        Find the first gdb prompt at the beginning of a line, or -1.
         """
-        # TODO: add timeout?
-        while (not self.last_stdout_line.startswith(b"(gdb) ") and
-               self.proc.poll() is None):
-            block = self.proc.stdout.read(4096)
-            if self.verbose:
-                sys.stdout.buffer.write(block)
-                sys.stdout.buffer.flush()
-            block, sep, last_line = block.rpartition(b"\n")
-            if sep:
-                self.last_stdout.append(self.last_stdout_line)
-                self.last_stdout.append(block + sep)
-                self.last_stdout_line = last_line
-            else:
-                assert block == b""
-                self.last_stdout_line += last_line
-
-        if self.proc.poll() is not None:
+        buf = self._buf
+        while True:
+            idx = buf.find(b"(gdb) ", start)
+            if idx <= 0 or buf[idx - 1:idx] == b"\n":
+                return idx
+            start = idx + 1
+
+    def wait_until_ready(self, nprompts=1):
+        """
+        Record output until the gdb prompt displays `nprompts` times.
+        Return recorded output, without the intermediate prompts.
+        """
+        buf = self._buf
+        view = self._chunk
+        outputs = []
+        start = 0
+        try:
+            while True:
+                idx = self._find_prompt(start)
+                if idx >= 0:
+                    outputs.append(bytes(buf[:idx]))
+                    # Keep anything after the prompt for the next call
+                    del buf[:idx + len(b"(gdb) ")]
+                    start = 0
+                    if len(outputs) == nprompts:
+                        break
+                    continue
+                if self.proc.poll() is not None:
+                    break
+                if not self._selector.select(self.timeout):
+                    # Unread output would garble any later command,
+                    # so make the session unusable instead
+                    self.join()
+                    raise TimeoutError(
+                        f"gdb didn't output anything in {self.timeout} s")
+                n = self._stdout_raw.readinto(view)
+                if not n:
+                    break
+                if self.verbose:
+                    self._echo += view[:n]
+                buf += view[:n]
+                # Only rescan the newly read data (plus enough overlap to
+                # catch a prompt straddling two reads)
+                start = max(0, len(buf) - n - 8)
+        finally:
+            self._flush_echo()
+
+        if len(outputs) < nprompts:
             raise IOError("gdb session terminated unexpectedly")
 
-        out = b"".join(self.last_stdout).decode('utf-8')
-        self.last_stdout = []
-        self.last_stdout_line = b""
-        return out
+        return b"".join(outputs).decode('utf-8')
 
     def issue_command(self, line):
+        if self.proc is None:
+            raise IOError("gdb session was terminated")
         line = line.encode('utf-8') + b"\n"
         if self.verbose:
-            sys.stdout.buffer.write(line)
-            sys.stdout.buffer.flush()
+            # Echoed along with the command output in wait_until_ready()
+            self._echo += line
         self.proc.stdin.write(line)
         self.proc.stdin.flush()
 
@@ -114,35 +208,71 @@ class GdbSession:
         self.issue_command(line)
         return self.wait_until_ready()
 
+    def run_commands(self, lines):
+        """
+        Run several commands in a single round-trip.  Return their
+        combined output.
+        """
+        self.issue_command("\n".join(lines))
+        return self.wait_until_ready(len(lines))
+
     def print_value(self, expr):
         """
         Ask gdb to print the value of an expression and return the result.
         """
         out = self.run_command(f"p {expr}")
-        out, n = re.subn(r"^\$\d+ = ", "", out)
+        out, n = _PRINT_PREFIX_RE.subn("", out)
         assert n == 1, out
         # gdb may add whitespace depending on result width, remove it
         return out.strip()
 
+    def print_values(self, exprs):
+        """
+        Ask gdb to print the values of several expressions and return
+        the results.
+
+        All commands are issued at once and the outputs are told apart
+        using sentinel lines, so that only one round-trip is needed.
+        """
+        lines = []
+        for i, expr in enumerate(exprs):
+            lines.append(f"echo {_VALUE_BEGIN} {i}\\n")
+            lines.append(f"p {expr}")
+            lines.append(f"echo {_VALUE_END}\\n")
+        out = self.run_commands(lines)
+        blocks = _VALUE_BLOCK_RE.findall(out)
+        assert [int(i) for i, _ in blocks] == list(range(len(exprs))), out
+
+        values = []
+        for expr, (_, block) in zip(exprs, blocks):
+            value, n = _PRINT_PREFIX_RE.subn("", block)
+            # If printing failed, the error message went to stderr
+            assert n == 1, (expr, block)
+            # gdb may add whitespace depending on result width, remove it
+            values.append(value.strip())
+        return values
+
     def select_frame(self, func_name):
         """
         Select the innermost frame with the given function name.
+        Return the frame number.
         """
         # Ideally, we would use the "frame function" command,
         # but it's not available on old GDB versions (such as 8.1.1),
         # so instead parse the stack trace for a matching frame number.
         out = self.run_command("info stack")
-        pat = r"(?mi)^#(\d+)\s+.* in " + re.escape(func_name) + " "
-        m = re.search(pat, out)
+        m = _frame_re(func_name).search(out)
         if m is None:
             pytest.fail(f"Could not select frame for function {func_name}")
 
         frame_num = int(m[1])
         out = self.run_command(f"frame {frame_num}")
         assert f"in {func_name}" in out
+        return frame_num
 
     def join(self):
         if self.proc is not None:
+            self._selector.close()
             self.proc.stdin.close()
             self.proc.stdout.close()  # avoid ResourceWarning
             self.proc.kill()
@@ -159,28 +289,68 @@ def gdb():
     gdb = GdbSession("-q", python_executable())
     try:
         gdb.wait_until_ready()
-        gdb.run_command("set confirm off")
-        gdb.run_command("set print array-indexes on")
-        # Make sure gdb formatting is not terminal-dependent
-        gdb.run_command("set width unlimited")
-        gdb.run_command("set charset UTF-8")
+        gdb.run_commands([
+            "set confirm off",
+            # Never stop a long output to ask for confirmation
+            "set pagination off",
+            "set print array-indexes on",
+            # Values must be printed on a single line
+            "set print pretty off",
+            # Make sure gdb formatting is not terminal-dependent
+            "set width unlimited",
+            "set charset UTF-8",
+        ])
         yield gdb
     finally:
         gdb.join()
 
 
+# A few values printed once at session start, see _armed_gdb
+_WARMUP_EXPRS = ["int32_array", "chunked_array", "*schema_empty",
+                 "*table", "empty_datum"]
+
+
 @pytest.fixture(scope='session')
-def gdb_arrow(gdb):
-    assert os.path.exists(gdb_script), "GDB script not found"
+def _armed_gdb(gdb):
+    """
+    A gdb session stopped in the Arrow test program, along with the
+    number of the TestSession frame.
+    """
+    assert is_gdb_script_available(), "GDB script not found"
     gdb.run_command(f"source {gdb_script}")
     code = "from pyarrow.lib import _gdb_test_session; _gdb_test_session()"
     out = gdb.run_command(f"run -c '{code}'")
     assert ("Trace/breakpoint trap" in out or
             "received signal" in out), out
-    gdb.select_frame("arrow::gdb::TestSession")
+    frame_num = gdb.select_frame("arrow::gdb::TestSession")
+    # Warm up the pretty-printers for the main kinds of values, so that
+    # one-time lookups don't happen while running individual tests.
+    # The output is discarded.
+    gdb.run_commands([f"p {expr}" for expr in _WARMUP_EXPRS])
+    return gdb, frame_num
+
+
+@pytest.fixture
+def gdb_arrow(_armed_gdb):
+    gdb, frame_num = _armed_gdb
+    # Cheap reset in case a previous test selected another frame
+    gdb.run_command(f"frame {frame_num}")
     return gdb
 
 
+@pytest.fixture
+def gdb_arrow_summary(gdb_arrow):
+    """
+    Like gdb_arrow, with the GDB script in summary-only mode
+    (the "arrow-summary" setting).
+    """
+    gdb_arrow.run_command("set arrow-summary on")
+    try:
+        yield gdb_arrow
+    finally:
+        gdb_arrow.run_command("set arrow-summary off")
+
+
 def test_gdb_session(gdb):
     out = gdb.run_command("show version")
     assert out.startswith("GNU gdb ("), out
@@ -191,666 +361,686 @@ def test_gdb_arrow(gdb_arrow):
     assert s == "43"
 
 
+# Checks queued by check_stack_repr() and friends inside a batched_checks()
+# block, as (gdb, expr, expected, checker) tuples, or None outside of it.
+_deferred_checks = None
+
+
+@contextlib.contextmanager
+def batched_checks():
+    """
+    Evaluate all checks issued in the block in a single gdb round-trip,
+    when exiting the block.
+
+    Outside of such a block, check_stack_repr() and friends evaluate
+    their check immediately.
+    """
+    global _deferred_checks
+    assert _deferred_checks is None, "batched_checks() blocks can't nest"
+    _deferred_checks = []
+    try:
+        yield
+        checks = _deferred_checks
+    finally:
+        _deferred_checks = None
+    by_session = {}
+    for gdb, *check in checks:
+        by_session.setdefault(gdb, []).append(check)
+    for gdb, session_checks in by_session.items():
+        values = gdb.print_values([expr for expr, _, _ in session_checks])
+        for (expr, expected, checker), s in zip(session_checks, values):
+            checker(expr, s, expected)
+
+
+def _check_repr(gdb, expr, expected, checker):
+    if _deferred_checks is not None:
+        _deferred_checks.append((gdb, expr, expected, checker))
+    else:
+        checker(expr, gdb.print_value(expr), expected)
+
+
+class Prefix:
+    """
+    An expected representation that only needs to match at the start.
+
+    This is cheaper than matching a regex anchored at the start.
+    """
+    __slots__ = ('s',)
+
+    def __init__(self, s):
+        self.s = s
+
+    def __repr__(self):
+        return f"Prefix({self.s!r})"
+
+
+def _check_stack_value(expr, s, expected):
+    assert s == expected, (expr, s)
+
+
+def _check_stack_match(expr, s, pattern):
+    assert pattern.match(s), (expr, s)
+
+
+def _check_stack_prefix(expr, s, prefix):
+    assert s.startswith(prefix.s), (expr, s)
+
+
+def _check_heap_value(expr, s, expected):
+    # GDB may prefix the value with an adress or type specification
+    if s != expected:
+        assert s.endswith(f" {expected}"), (expr, s)
+
+
 def check_stack_repr(gdb, expr, expected):
     """
     Check printing a stack-located value.
     """
-    s = gdb.print_value(expr)
-    if isinstance(expected, re.Pattern):
-        assert expected.match(s), s
-    else:
-        assert s == expected
+    _check_repr(gdb, expr, expected, _check_stack_value)
+
+
+def check_stack_repr_re(gdb, expr, pattern):
+    """
+    Check printing a stack-located value against a compiled regex.
+    """
+    _check_repr(gdb, expr, pattern, _check_stack_match)
+
+
+def check_stack_repr_prefix(gdb, expr, prefix):
+    """
+    Check that printing a stack-located value starts with the given
+    Prefix.
+    """
+    _check_repr(gdb, expr, prefix, _check_stack_prefix)
 
 
 def check_heap_repr(gdb, expr, expected):
     """
     Check printing a heap-located value, given its address.
     """
-    s = gdb.print_value(f"*{expr}")
-    # GDB may prefix the value with an adress or type specification
-    if s != expected:
-        assert s.endswith(f" {expected}")
+    _check_repr(gdb, f"*{expr}", expected, _check_heap_value)
 
 
 def test_status(gdb_arrow):
-    check_stack_repr(gdb_arrow, "ok_status", "arrow::Status::OK()")
-    check_stack_repr(gdb_arrow, "error_status",
-                     'arrow::Status::IOError("This is an error")')
-    check_stack_repr(
-        gdb_arrow, "error_detail_status",
-        'arrow::Status::IOError("This is an error", '
-        'detail=[custom-detail-id] "This is a detail")')
-
-    check_stack_repr(gdb_arrow, "ok_result", "arrow::Result<int>(42)")
-    check_stack_repr(
-        gdb_arrow, "error_result",
-        'arrow::Result<int>(arrow::Status::IOError("This is an error"))')
-    check_stack_repr(
-        gdb_arrow, "error_detail_result",
-        'arrow::Result<int>(arrow::Status::IOError("This is an error", '
-        'detail=[custom-detail-id] "This is a detail"))')
+    with batched_checks():
+        check_stack_repr(gdb_arrow, "ok_status", "arrow::Status::OK()")
+        check_stack_repr(gdb_arrow, "error_status",
+                         'arrow::Status::IOError("This is an error")')
+        check_stack_repr(
+            gdb_arrow, "error_detail_status",
+            'arrow::Status::IOError("This is an error", '
+            'detail=[custom-detail-id] "This is a detail")')
+
+        check_stack_repr(gdb_arrow, "ok_result", "arrow::Result<int>(42)")
+        check_stack_repr(
+            gdb_arrow, "error_result",
+            'arrow::Result<int>(arrow::Status::IOError("This is an error"))')
+        check_stack_repr(
+            gdb_arrow, "error_detail_result",
+            'arrow::Result<int>(arrow::Status::IOError("This is an error", '
+            'detail=[custom-detail-id] "This is a detail"))')
 
 
 def test_string_view(gdb_arrow):
-    check_stack_repr(gdb_arrow, "string_view_empty",
-                     "arrow::util::string_view of size 0")
-    check_stack_repr(gdb_arrow, "string_view_abc",
-                     'arrow::util::string_view of size 3, "abc"')
-    check_stack_repr(
-        gdb_arrow, "string_view_special_chars",
-        r'arrow::util::string_view of size 12, "foo\"bar\000\r\n\t\037"')
-    check_stack_repr(
-        gdb_arrow, "string_view_very_long",
-        'arrow::util::string_view of size 5006, '
-        '"abc", \'K\' <repeats 5000 times>...')
+    with batched_checks():
+        check_stack_repr(gdb_arrow, "string_view_empty",
+                         "arrow::util::string_view of size 0")
+        check_stack_repr(gdb_arrow, "string_view_abc",
+                         'arrow::util::string_view of size 3, "abc"')
+        check_stack_repr(
+            gdb_arrow, "string_view_special_chars",
+            r'arrow::util::string_view of size 12, "foo\"bar\000\r\n\t\037"')
+        check_stack_repr(
+            gdb_arrow, "string_view_very_long",
+            'arrow::util::string_view of size 5006, '
+            '"abc", \'K\' <repeats 5000 times>...')
 
 
 def test_buffer_stack(gdb_arrow):
-    check_stack_repr(gdb_arrow, "buffer_null",
-                     "arrow::Buffer of size 0, read-only")
-    check_stack_repr(gdb_arrow, "buffer_abc",
-                     'arrow::Buffer of size 3, read-only, "abc"')
-    check_stack_repr(
-        gdb_arrow, "buffer_special_chars",
-        r'arrow::Buffer of size 12, read-only, "foo\"bar\000\r\n\t\037"')
-    check_stack_repr(gdb_arrow, "buffer_mutable",
-                     'arrow::MutableBuffer of size 3, mutable, "abc"')
+    with batched_checks():
+        check_stack_repr(gdb_arrow, "buffer_null",
+                         "arrow::Buffer of size 0, read-only")
+        check_stack_repr(gdb_arrow, "buffer_abc",
+                         'arrow::Buffer of size 3, read-only, "abc"')
+        check_stack_repr(
+            gdb_arrow, "buffer_special_chars",
+            r'arrow::Buffer of size 12, read-only, "foo\"bar\000\r\n\t\037"')
+        check_stack_repr(gdb_arrow, "buffer_mutable",
+                         'arrow::MutableBuffer of size 3, mutable, "abc"')
 
 
 def test_buffer_heap(gdb_arrow):
-    check_heap_repr(gdb_arrow, "heap_buffer",
-                    'arrow::Buffer of size 3, read-only, "abc"')
-    check_heap_repr(gdb_arrow, "heap_buffer_mutable.get()",
-                    'arrow::Buffer of size 3, mutable, "abc"')
+    with batched_checks():
+        check_heap_repr(gdb_arrow, "heap_buffer",
+                        'arrow::Buffer of size 3, read-only, "abc"')
+        check_heap_repr(gdb_arrow, "heap_buffer_mutable.get()",
+                        'arrow::Buffer of size 3, mutable, "abc"')
 
 
 def test_optionals(gdb_arrow):
-    check_stack_repr(gdb_arrow, "int_optional",
-                     "arrow::util::optional<int>(42)")
-    check_stack_repr(gdb_arrow, "null_int_optional",
-                     "arrow::util::optional<int>(nullopt)")
+    with batched_checks():
+        check_stack_repr(gdb_arrow, "int_optional",
+                         "arrow::util::optional<int>(42)")
+        check_stack_repr(gdb_arrow, "null_int_optional",
+                         "arrow::util::optional<int>(nullopt)")
+
+
+_RE_STRING_VARIANT = re.compile(
+    r'^arrow::util::Variant of index 2 \(actual type '
+    r'std::.*string.*\), value .*"hello".*')
 
 
 def test_variants(gdb_arrow):
-    check_stack_repr(
-        gdb_arrow, "int_variant",
-        "arrow::util::Variant of index 0 (actual type int), value 42")
-    check_stack_repr(
-        gdb_arrow, "bool_variant",
-        "arrow::util::Variant of index 1 (actual type bool), value false")
-    check_stack_repr(
-        gdb_arrow, "string_variant",
-        re.compile(r'^arrow::util::Variant of index 2 \(actual type '
-                   r'std::.*string.*\), value .*"hello".*'))
+    with batched_checks():
+        check_stack_repr(
+            gdb_arrow, "int_variant",
+            "arrow::util::Variant of index 0 (actual type int), value 42")
+        check_stack_repr(
+            gdb_arrow, "bool_variant",
+            "arrow::util::Variant of index 1 (actual type bool), value false")
+        check_stack_repr_re(gdb_arrow, "string_variant", _RE_STRING_VARIANT)
 
 
 def test_decimals(gdb_arrow):
-    v128 = "98765432109876543210987654321098765432"
-    check_stack_repr(gdb_arrow, "decimal128_zero", "arrow::Decimal128(0)")
-    check_stack_repr(gdb_arrow, "decimal128_pos",
-                     f"arrow::Decimal128({v128})")
-    check_stack_repr(gdb_arrow, "decimal128_neg",
-                     f"arrow::Decimal128(-{v128})")
-    check_stack_repr(gdb_arrow, "basic_decimal128_zero",
-                     "arrow::BasicDecimal128(0)")
-    check_stack_repr(gdb_arrow, "basic_decimal128_pos",
-                     f"arrow::BasicDecimal128({v128})")
-    check_stack_repr(gdb_arrow, "basic_decimal128_neg",
-                     f"arrow::BasicDecimal128(-{v128})")
-
-    v256 = ("9876543210987654321098765432109876543210"
-            "987654321098765432109876543210987654")
-    check_stack_repr(gdb_arrow, "decimal256_zero", "arrow::Decimal256(0)")
-    check_stack_repr(gdb_arrow, "decimal256_pos",
-                     f"arrow::Decimal256({v256})")
-    check_stack_repr(gdb_arrow, "decimal256_neg",
-                     f"arrow::Decimal256(-{v256})")
-    check_stack_repr(gdb_arrow, "basic_decimal256_zero",
-                     "arrow::BasicDecimal256(0)")
-    check_stack_repr(gdb_arrow, "basic_decimal256_pos",
-                     f"arrow::BasicDecimal256({v256})")
-    check_stack_repr(gdb_arrow, "basic_decimal256_neg",
-                     f"arrow::BasicDecimal256(-{v256})")
+    with batched_checks():
+        v128 = "98765432109876543210987654321098765432"
+        check_stack_repr(gdb_arrow, "decimal128_zero", "arrow::Decimal128(0)")
+        check_stack_repr(gdb_arrow, "decimal128_pos",
+                         f"arrow::Decimal128({v128})")
+        check_stack_repr(gdb_arrow, "decimal128_neg",
+                         f"arrow::Decimal128(-{v128})")
+        check_stack_repr(gdb_arrow, "basic_decimal128_zero",
+                         "arrow::BasicDecimal128(0)")
+        check_stack_repr(gdb_arrow, "basic_decimal128_pos",
+                         f"arrow::BasicDecimal128({v128})")
+        check_stack_repr(gdb_arrow, "basic_decimal128_neg",
+                         f"arrow::BasicDecimal128(-{v128})")
+
+        v256 = ("9876543210987654321098765432109876543210"
+                "987654321098765432109876543210987654")
+        check_stack_repr(gdb_arrow, "decimal256_zero", "arrow::Decimal256(0)")
+        check_stack_repr(gdb_arrow, "decimal256_pos",
+                         f"arrow::Decimal256({v256})")
+        check_stack_repr(gdb_arrow, "decimal256_neg",
+                         f"arrow::Decimal256(-{v256})")
+        check_stack_repr(gdb_arrow, "basic_decimal256_zero",
+                         "arrow::BasicDecimal256(0)")
+        check_stack_repr(gdb_arrow, "basic_decimal256_pos",
+                         f"arrow::BasicDecimal256({v256})")
+        check_stack_repr(gdb_arrow, "basic_decimal256_neg",
+                         f"arrow::BasicDecimal256(-{v256})")
 
 
 def test_metadata(gdb_arrow):
-    check_heap_repr(gdb_arrow, "empty_metadata.get()",
-                    "arrow::KeyValueMetadata of size 0")
-    check_heap_repr(
-        gdb_arrow, "metadata.get()",
-        ('arrow::KeyValueMetadata of size 2 = {'
-         '["key_text"] = "some value", ["key_binary"] = "z\\000\\037\\377"}'))
+    with batched_checks():
+        check_heap_repr(gdb_arrow, "empty_metadata.get()",
+                        "arrow::KeyValueMetadata of size 0")
+        check_heap_repr(
+            gdb_arrow, "metadata.get()",
+            ('arrow::KeyValueMetadata of size 2 = {'
+             '["key_text"] = "some value", '
+             '["key_binary"] = "z\\000\\037\\377"}'))
+
+
+TYPES_STACK_CASES = (
+    ("null_type", "arrow::null()"),
+    ("bool_type", "arrow::boolean()"),
+
+    ("date32_type", "arrow::date32()"),
+    ("date64_type", "arrow::date64()"),
+    ("time_type_s", "arrow::time32(arrow::TimeUnit::SECOND)"),
+    ("time_type_ms", "arrow::time32(arrow::TimeUnit::MILLI)"),
+    ("time_type_us", "arrow::time64(arrow::TimeUnit::MICRO)"),
+    ("time_type_ns", "arrow::time64(arrow::TimeUnit::NANO)"),
+    ("timestamp_type_s", "arrow::timestamp(arrow::TimeUnit::SECOND)"),
+    ("timestamp_type_ms_timezone",
+     'arrow::timestamp(arrow::TimeUnit::MILLI, "Europe/Paris")'),
+    ("timestamp_type_us", "arrow::timestamp(arrow::TimeUnit::MICRO)"),
+    ("timestamp_type_ns_timezone",
+     'arrow::timestamp(arrow::TimeUnit::NANO, "Europe/Paris")'),
+
+    ("day_time_interval_type", "arrow::day_time_interval()"),
+    ("month_interval_type", "arrow::month_interval()"),
+    ("month_day_nano_interval_type", "arrow::month_day_nano_interval()"),
+    ("duration_type_s", "arrow::duration(arrow::TimeUnit::SECOND)"),
+    ("duration_type_ns", "arrow::duration(arrow::TimeUnit::NANO)"),
+
+    ("decimal128_type", "arrow::decimal128(16, 5)"),
+    ("decimal256_type", "arrow::decimal256(42, 12)"),
+
+    ("binary_type", "arrow::binary()"),
+    ("string_type", "arrow::utf8()"),
+    ("large_binary_type", "arrow::large_binary()"),
+    ("large_string_type", "arrow::large_utf8()"),
+    ("fixed_size_binary_type", "arrow::fixed_size_binary(10)"),
+
+    ("list_type", "arrow::list(arrow::uint8())"),
+    ("large_list_type", "arrow::large_list(arrow::large_utf8())"),
+    ("fixed_size_list_type", "arrow::fixed_size_list(arrow::float64(), 3)"),
+    ("map_type_unsorted",
+     "arrow::map(arrow::utf8(), arrow::binary(), keys_sorted=false)"),
+    ("map_type_sorted",
+     "arrow::map(arrow::utf8(), arrow::binary(), keys_sorted=true)"),
+
+    ("struct_type_empty", "arrow::struct_({})"),
+    ("struct_type",
+     ('arrow::struct_({arrow::field("ints", arrow::int8()), '
+      'arrow::field("strs", arrow::utf8(), nullable=false)})')),
+
+    ("sparse_union_type",
+     ('arrow::sparse_union(fields={arrow::field("ints", arrow::int8()), '
+      'arrow::field("strs", arrow::utf8(), nullable=false)}, '
+      'type_codes={7, 42})')),
+    ("dense_union_type",
+     ('arrow::dense_union(fields={arrow::field("ints", arrow::int8()), '
+      'arrow::field("strs", arrow::utf8(), nullable=false)}, '
+      'type_codes={7, 42})')),
+
+    ("dict_type_unordered",
+     "arrow::dictionary(arrow::int16(), arrow::utf8(), ordered=false)"),
+    ("dict_type_ordered",
+     "arrow::dictionary(arrow::int16(), arrow::utf8(), ordered=true)"),
+
+    ("uuid_type",
+     ('arrow::ExtensionType "extension<uuid>" '
+      'with storage type arrow::fixed_size_binary(16)')),
+)
 
 
 def test_types_stack(gdb_arrow):
-    check_stack_repr(gdb_arrow, "null_type", "arrow::null()")
-    check_stack_repr(gdb_arrow, "bool_type", "arrow::boolean()")
-
-    check_stack_repr(gdb_arrow, "date32_type", "arrow::date32()")
-    check_stack_repr(gdb_arrow, "date64_type", "arrow::date64()")
-    check_stack_repr(gdb_arrow, "time_type_s",
-                     "arrow::time32(arrow::TimeUnit::SECOND)")
-    check_stack_repr(gdb_arrow, "time_type_ms",
-                     "arrow::time32(arrow::TimeUnit::MILLI)")
-    check_stack_repr(gdb_arrow, "time_type_us",
-                     "arrow::time64(arrow::TimeUnit::MICRO)")
-    check_stack_repr(gdb_arrow, "time_type_ns",
-                     "arrow::time64(arrow::TimeUnit::NANO)")
-    check_stack_repr(gdb_arrow, "timestamp_type_s",
-                     "arrow::timestamp(arrow::TimeUnit::SECOND)")
-    check_stack_repr(
-        gdb_arrow, "timestamp_type_ms_timezone",
-        'arrow::timestamp(arrow::TimeUnit::MILLI, "Europe/Paris")')
-    check_stack_repr(gdb_arrow, "timestamp_type_us",
-                     "arrow::timestamp(arrow::TimeUnit::MICRO)")
-    check_stack_repr(
-        gdb_arrow, "timestamp_type_ns_timezone",
-        'arrow::timestamp(arrow::TimeUnit::NANO, "Europe/Paris")')
-
-    check_stack_repr(gdb_arrow, "day_time_interval_type",
-                     "arrow::day_time_interval()")
-    check_stack_repr(gdb_arrow, "month_interval_type",
-                     "arrow::month_interval()")
-    check_stack_repr(gdb_arrow, "month_day_nano_interval_type",
-                     "arrow::month_day_nano_interval()")
-    check_stack_repr(gdb_arrow, "duration_type_s",
-                     "arrow::duration(arrow::TimeUnit::SECOND)")
-    check_stack_repr(gdb_arrow, "duration_type_ns",
-                     "arrow::duration(arrow::TimeUnit::NANO)")
-
-    check_stack_repr(gdb_arrow, "decimal128_type",
-                     "arrow::decimal128(16, 5)")
-    check_stack_repr(gdb_arrow, "decimal256_type",
-                     "arrow::decimal256(42, 12)")
-
-    check_stack_repr(gdb_arrow, "binary_type", "arrow::binary()")
-    check_stack_repr(gdb_arrow, "string_type", "arrow::utf8()")
-    check_stack_repr(gdb_arrow, "large_binary_type", "arrow::large_binary()")
-    check_stack_repr(gdb_arrow, "large_string_type", "arrow::large_utf8()")
-    check_stack_repr(gdb_arrow, "fixed_size_binary_type",
-                     "arrow::fixed_size_binary(10)")
-
-    check_stack_repr(gdb_arrow, "list_type",
-                     "arrow::list(arrow::uint8())")
-    check_stack_repr(gdb_arrow, "large_list_type",
-                     "arrow::large_list(arrow::large_utf8())")
-    check_stack_repr(gdb_arrow, "fixed_size_list_type",
-                     "arrow::fixed_size_list(arrow::float64(), 3)")
-    check_stack_repr(
-        gdb_arrow, "map_type_unsorted",
-        "arrow::map(arrow::utf8(), arrow::binary(), keys_sorted=false)")
-    check_stack_repr(
-        gdb_arrow, "map_type_sorted",
-        "arrow::map(arrow::utf8(), arrow::binary(), keys_sorted=true)")
-
-    check_stack_repr(gdb_arrow, "struct_type_empty",
-                     "arrow::struct_({})")
-    check_stack_repr(
-        gdb_arrow, "struct_type",
-        ('arrow::struct_({arrow::field("ints", arrow::int8()), '
-         'arrow::field("strs", arrow::utf8(), nullable=false)})'))
-
-    check_stack_repr(
-        gdb_arrow, "sparse_union_type",
-        ('arrow::sparse_union(fields={arrow::field("ints", arrow::int8()), '
-         'arrow::field("strs", arrow::utf8(), nullable=false)}, '
-         'type_codes={7, 42})'))
-    check_stack_repr(
-        gdb_arrow, "dense_union_type",
-        ('arrow::dense_union(fields={arrow::field("ints", arrow::int8()), '
-         'arrow::field("strs", arrow::utf8(), nullable=false)}, '
-         'type_codes={7, 42})'))
-
-    check_stack_repr(
-        gdb_arrow, "dict_type_unordered",
-        "arrow::dictionary(arrow::int16(), arrow::utf8(), ordered=false)")
-    check_stack_repr(
-        gdb_arrow, "dict_type_ordered",
-        "arrow::dictionary(arrow::int16(), arrow::utf8(), ordered=true)")
-
-    check_stack_repr(
-        gdb_arrow, "uuid_type",
-        ('arrow::ExtensionType "extension<uuid>" '
-         'with storage type arrow::fixed_size_binary(16)'))
+    with batched_checks():
+        for expr, expected in TYPES_STACK_CASES:
+            check_stack_repr(gdb_arrow, expr, expected)
 
 
 def test_types_heap(gdb_arrow):
-    check_heap_repr(gdb_arrow, "heap_null_type", "arrow::null()")
-    check_heap_repr(gdb_arrow, "heap_bool_type", "arrow::boolean()")
-
-    check_heap_repr(gdb_arrow, "heap_time_type_ns",
-                    "arrow::time64(arrow::TimeUnit::NANO)")
-    check_heap_repr(
-        gdb_arrow, "heap_timestamp_type_ns_timezone",
-        'arrow::timestamp(arrow::TimeUnit::NANO, "Europe/Paris")')
-
-    check_heap_repr(gdb_arrow, "heap_decimal128_type",
-                    "arrow::decimal128(16, 5)")
-
-    check_heap_repr(gdb_arrow, "heap_list_type",
-                    "arrow::list(arrow::uint8())")
-    check_heap_repr(gdb_arrow, "heap_large_list_type",
-                    "arrow::large_list(arrow::large_utf8())")
-    check_heap_repr(gdb_arrow, "heap_fixed_size_list_type",
-                    "arrow::fixed_size_list(arrow::float64(), 3)")
-    check_heap_repr(
-        gdb_arrow, "heap_map_type",
-        "arrow::map(arrow::utf8(), arrow::binary(), keys_sorted=false)")
-
-    check_heap_repr(
-        gdb_arrow, "heap_struct_type",
-        ('arrow::struct_({arrow::field("ints", arrow::int8()), '
-         'arrow::field("strs", arrow::utf8(), nullable=false)})'))
-
-    check_heap_repr(
-        gdb_arrow, "heap_dict_type",
-        "arrow::dictionary(arrow::int16(), arrow::utf8(), ordered=false)")
-
-    check_heap_repr(
-        gdb_arrow, "heap_uuid_type",
-        ('arrow::ExtensionType "extension<uuid>" '
-         'with storage type arrow::fixed_size_binary(16)'))
+    with batched_checks():
+        check_heap_repr(gdb_arrow, "heap_null_type", "arrow::null()")
+        check_heap_repr(gdb_arrow, "heap_bool_type", "arrow::boolean()")
+
+        check_heap_repr(gdb_arrow, "heap_time_type_ns",
+                        "arrow::time64(arrow::TimeUnit::NANO)")
+        check_heap_repr(
+            gdb_arrow, "heap_timestamp_type_ns_timezone",
+            'arrow::timestamp(arrow::TimeUnit::NANO, "Europe/Paris")')
+
+        check_heap_repr(gdb_arrow, "heap_decimal128_type",
+                        "arrow::decimal128(16, 5)")
+
+        check_heap_repr(gdb_arrow, "heap_list_type",
+                        "arrow::list(arrow::uint8())")
+        check_heap_repr(gdb_arrow, "heap_large_list_type",
+                        "arrow::large_list(arrow::large_utf8())")
+        check_heap_repr(gdb_arrow, "heap_fixed_size_list_type",
+                        "arrow::fixed_size_list(arrow::float64(), 3)")
+        check_heap_repr(
+            gdb_arrow, "heap_map_type",
+            "arrow::map(arrow::utf8(), arrow::binary(), keys_sorted=false)")
+
+        check_heap_repr(
+            gdb_arrow, "heap_struct_type",
+            ('arrow::struct_({arrow::field("ints", arrow::int8()), '
+             'arrow::field("strs", arrow::utf8(), nullable=false)})'))
+
+        check_heap_repr(
+            gdb_arrow, "heap_dict_type",
+            "arrow::dictionary(arrow::int16(), arrow::utf8(), ordered=false)")
+
+        check_heap_repr(
+            gdb_arrow, "heap_uuid_type",
+            ('arrow::ExtensionType "extension<uuid>" '
+             'with storage type arrow::fixed_size_binary(16)'))
 
 
 def test_fields_stack(gdb_arrow):
-    check_stack_repr(gdb_arrow, "int_field",
-                     'arrow::field("ints", arrow::int64())')
-    check_stack_repr(
-        gdb_arrow, "float_field",
-        'arrow::field("floats", arrow::float32(), nullable=false)')
+    with batched_checks():
+        check_stack_repr(gdb_arrow, "int_field",
+                         'arrow::field("ints", arrow::int64())')
+        check_stack_repr(
+            gdb_arrow, "float_field",
+            'arrow::field("floats", arrow::float32(), nullable=false)')
 
 
 def test_fields_heap(gdb_arrow):
-    check_heap_repr(gdb_arrow, "heap_int_field",
-                    'arrow::field("ints", arrow::int64())')
+    with batched_checks():
+        check_heap_repr(gdb_arrow, "heap_int_field",
+                        'arrow::field("ints", arrow::int64())')
+
+
+SCALARS_STACK_CASES = (
+    ("null_scalar", "arrow::NullScalar"),
+    ("bool_scalar", "arrow::BooleanScalar of value true"),
+    ("bool_scalar_null", "arrow::BooleanScalar of null value"),
+    ("int8_scalar", "arrow::Int8Scalar of value -42"),
+    ("uint8_scalar", "arrow::UInt8Scalar of value 234"),
+    ("int64_scalar", "arrow::Int64Scalar of value -9223372036854775808"),
+    ("uint64_scalar", "arrow::UInt64Scalar of value 18446744073709551615"),
+    ("half_float_scalar", "arrow::HalfFloatScalar of value -1.5 [48640]"),
+    ("float_scalar", "arrow::FloatScalar of value 1.25"),
+    ("double_scalar", "arrow::DoubleScalar of value 2.5"),
+
+    ("time_scalar_s", "arrow::Time32Scalar of value 100s"),
+    ("time_scalar_ms", "arrow::Time32Scalar of value 1000ms"),
+    ("time_scalar_us", "arrow::Time64Scalar of value 10000us"),
+    ("time_scalar_ns", "arrow::Time64Scalar of value 100000ns"),
+    ("time_scalar_null", "arrow::Time64Scalar of null value [ns]"),
+
+    ("duration_scalar_s", "arrow::DurationScalar of value -100s"),
+    ("duration_scalar_ms", "arrow::DurationScalar of value -1000ms"),
+    ("duration_scalar_us", "arrow::DurationScalar of value -10000us"),
+    ("duration_scalar_ns", "arrow::DurationScalar of value -100000ns"),
+    ("duration_scalar_null", "arrow::DurationScalar of null value [ns]"),
+
+    ("timestamp_scalar_s",
+     "arrow::TimestampScalar of value 12345s [no timezone]"),
+    ("timestamp_scalar_ms",
+     "arrow::TimestampScalar of value -123456ms [no timezone]"),
+    ("timestamp_scalar_us",
+     "arrow::TimestampScalar of value 1234567us [no timezone]"),
+    ("timestamp_scalar_ns",
+     "arrow::TimestampScalar of value -12345678ns [no timezone]"),
+    ("timestamp_scalar_null",
+     "arrow::TimestampScalar of null value [ns, no timezone]"),
+
+    ("timestamp_scalar_s_tz",
+     'arrow::TimestampScalar of value 12345s ["Europe/Paris"]'),
+    ("timestamp_scalar_ms_tz",
+     'arrow::TimestampScalar of value -123456ms ["Europe/Paris"]'),
+    ("timestamp_scalar_us_tz",
+     'arrow::TimestampScalar of value 1234567us ["Europe/Paris"]'),
+    ("timestamp_scalar_ns_tz",
+     'arrow::TimestampScalar of value -12345678ns ["Europe/Paris"]'),
+    ("timestamp_scalar_null_tz",
+     'arrow::TimestampScalar of null value [ns, "Europe/Paris"]'),
+
+    ("month_interval_scalar", "arrow::MonthIntervalScalar of value 23M"),
+    ("month_interval_scalar_null", "arrow::MonthIntervalScalar of null value"),
+    ("day_time_interval_scalar",
+     "arrow::DayTimeIntervalScalar of value 23d-456ms"),
+    ("day_time_interval_scalar_null",
+     "arrow::DayTimeIntervalScalar of null value"),
+    ("month_day_nano_interval_scalar",
+     "arrow::MonthDayNanoIntervalScalar of value 1M23d-456ns"),
+    ("month_day_nano_interval_scalar_null",
+     "arrow::MonthDayNanoIntervalScalar of null value"),
+
+    ("date32_scalar", "arrow::Date32Scalar of value 23d"),
+    ("date32_scalar_null", "arrow::Date32Scalar of null value"),
+    ("date64_scalar", "arrow::Date64Scalar of value 3870000000ms"),
+    ("date64_scalar_null", "arrow::Date64Scalar of null value"),
+
+    ("decimal128_scalar_null",
+     "arrow::Decimal128Scalar of null value [precision=10, scale=4]"),
+    ("decimal128_scalar_pos_scale_pos",
+     "arrow::Decimal128Scalar of value 123.4567 [precision=10, scale=4]"),
+    ("decimal128_scalar_pos_scale_neg",
+     "arrow::Decimal128Scalar of value -123.4567 [precision=10, scale=4]"),
+    ("decimal128_scalar_neg_scale_pos",
+     ("arrow::Decimal128Scalar of value 1.234567e+10 "
+      "[precision=10, scale=-4]")),
+    ("decimal128_scalar_neg_scale_neg",
+     ("arrow::Decimal128Scalar of value -1.234567e+10 "
+      "[precision=10, scale=-4]")),
+
+    ("decimal256_scalar_null",
+     "arrow::Decimal256Scalar of null value [precision=50, scale=4]"),
+    ("decimal256_scalar_pos_scale_pos",
+     ("arrow::Decimal256Scalar of value "
+      "123456789012345678901234567890123456789012.3456 "
+      "[precision=50, scale=4]")),
+    ("decimal256_scalar_pos_scale_neg",
+     ("arrow::Decimal256Scalar of value "
+      "-123456789012345678901234567890123456789012.3456 "
+      "[precision=50, scale=4]")),
+    ("decimal256_scalar_neg_scale_pos",
+     ("arrow::Decimal256Scalar of value "
+      "1.234567890123456789012345678901234567890123456e+49 "
+      "[precision=50, scale=-4]")),
+    ("decimal256_scalar_neg_scale_neg",
+     ("arrow::Decimal256Scalar of value "
+      "-1.234567890123456789012345678901234567890123456e+49 "
+      "[precision=50, scale=-4]")),
+
+    ("binary_scalar_null", "arrow::BinaryScalar of null value"),
+    ("binary_scalar_unallocated",
+     "arrow::BinaryScalar of value <unallocated>"),
+    ("binary_scalar_empty", 'arrow::BinaryScalar of size 0, value ""'),
+    ("binary_scalar_abc", 'arrow::BinaryScalar of size 3, value "abc"'),
+    ("binary_scalar_bytes",
+     r'arrow::BinaryScalar of size 3, value "\000\037\377"'),
+    ("large_binary_scalar_abc",
+     'arrow::LargeBinaryScalar of size 3, value "abc"'),
+
+    ("string_scalar_null", "arrow::StringScalar of null value"),
+    ("string_scalar_unallocated",
+     "arrow::StringScalar of value <unallocated>"),
+    ("string_scalar_empty", 'arrow::StringScalar of size 0, value ""'),
+    ("string_scalar_hehe", 'arrow::StringScalar of size 6, value "héhé"'),
+    # FIXME: excessive escaping ('\\xff' vs. '\x00')
+    ("string_scalar_invalid_chars",
+     r'arrow::StringScalar of size 11, value "abc\x00def\\xffghi"'),
+    ("large_string_scalar_hehe",
+     'arrow::LargeStringScalar of size 6, value "héhé"'),
+
+    ("fixed_size_binary_scalar",
+     'arrow::FixedSizeBinaryScalar of size 3, value "abc"'),
+    ("fixed_size_binary_scalar_null",
+     'arrow::FixedSizeBinaryScalar of size 3, null value'),
+
+    ("dict_scalar_null",
+     ('arrow::DictionaryScalar of type '
+      'arrow::dictionary(arrow::int8(), arrow::utf8(), ordered=false), '
+      'null value')),
+
+    ("list_scalar",
+     ('arrow::ListScalar of value arrow::Int32Array of '
+      'length 3, null count 0')),
+    ("list_scalar_null",
+     'arrow::ListScalar of type arrow::list(arrow::int32()), null value'),
+    ("large_list_scalar",
+     ('arrow::LargeListScalar of value arrow::Int32Array of '
+      'length 3, null count 0')),
+    ("large_list_scalar_null",
+     ('arrow::LargeListScalar of type arrow::large_list(arrow::int32()), '
+      'null value')),
+    ("fixed_size_list_scalar",
+     ('arrow::FixedSizeListScalar of value arrow::Int32Array of '
+      'length 3, null count 0')),
+    ("fixed_size_list_scalar_null",
+     ('arrow::FixedSizeListScalar of type '
+      'arrow::fixed_size_list(arrow::int32(), 3), null value')),
+
+    ("struct_scalar",
+     ('arrow::StructScalar = {["ints"] = arrow::Int32Scalar of value 42, '
+      '["strs"] = arrow::StringScalar of size 9, value "some text"}')),
+    ("struct_scalar_null",
+     ('arrow::StructScalar of type arrow::struct_('
+      '{arrow::field("ints", arrow::int32()), '
+      'arrow::field("strs", arrow::utf8())}), null value')),
+
+    ("sparse_union_scalar",
+     ('arrow::SparseUnionScalar of type code 7, '
+      'value arrow::Int32Scalar of value 43')),
+    ("dense_union_scalar",
+     ('arrow::DenseUnionScalar of type code 7, '
+      'value arrow::Int32Scalar of value 43')),
+
+    ("extension_scalar",
+     ('arrow::ExtensionScalar of type "extension<uuid>", '
+      'value arrow::FixedSizeBinaryScalar of size 16, '
+      'value "0123456789abcdef"')),
+    ("extension_scalar_null",
+     'arrow::ExtensionScalar of type "extension<uuid>", null value'),
+)
+
+
+SCALARS_STACK_RE_CASES = (
+    ("dict_scalar",
+     re.compile(r'^arrow::DictionaryScalar of index '
+                r'arrow::Int8Scalar of value 42, '
+                r'dictionary arrow::StringArray ')),
+    ("sparse_union_scalar_null",
+     re.compile(
+         r'^arrow::SparseUnionScalar of type arrow::sparse_union\(.*\), '
+         r'type code 7, null value$')),
+    ("dense_union_scalar_null",
+     re.compile(
+         r'^arrow::DenseUnionScalar of type arrow::dense_union\(.*\), '
+         r'type code 7, null value$')),
+)
 
 
 def test_scalars_stack(gdb_arrow):
-    check_stack_repr(gdb_arrow, "null_scalar", "arrow::NullScalar")
-    check_stack_repr(gdb_arrow, "bool_scalar",
-                     "arrow::BooleanScalar of value true")
-    check_stack_repr(gdb_arrow, "bool_scalar_null",
-                     "arrow::BooleanScalar of null value")
-    check_stack_repr(gdb_arrow, "int8_scalar",
-                     "arrow::Int8Scalar of value -42")
-    check_stack_repr(gdb_arrow, "uint8_scalar",
-                     "arrow::UInt8Scalar of value 234")
-    check_stack_repr(gdb_arrow, "int64_scalar",
-                     "arrow::Int64Scalar of value -9223372036854775808")
-    check_stack_repr(gdb_arrow, "uint64_scalar",
-                     "arrow::UInt64Scalar of value 18446744073709551615")
-    check_stack_repr(gdb_arrow, "half_float_scalar",
-                     "arrow::HalfFloatScalar of value -1.5 [48640]")
-    check_stack_repr(gdb_arrow, "float_scalar",
-                     "arrow::FloatScalar of value 1.25")
-    check_stack_repr(gdb_arrow, "double_scalar",
-                     "arrow::DoubleScalar of value 2.5")
-
-    check_stack_repr(gdb_arrow, "time_scalar_s",
-                     "arrow::Time32Scalar of value 100s")
-    check_stack_repr(gdb_arrow, "time_scalar_ms",
-                     "arrow::Time32Scalar of value 1000ms")
-    check_stack_repr(gdb_arrow, "time_scalar_us",
-                     "arrow::Time64Scalar of value 10000us")
-    check_stack_repr(gdb_arrow, "time_scalar_ns",
-                     "arrow::Time64Scalar of value 100000ns")
-    check_stack_repr(gdb_arrow, "time_scalar_null",
-                     "arrow::Time64Scalar of null value [ns]")
-
-    check_stack_repr(gdb_arrow, "duration_scalar_s",
-                     "arrow::DurationScalar of value -100s")
-    check_stack_repr(gdb_arrow, "duration_scalar_ms",
-                     "arrow::DurationScalar of value -1000ms")
-    check_stack_repr(gdb_arrow, "duration_scalar_us",
-                     "arrow::DurationScalar of value -10000us")
-    check_stack_repr(gdb_arrow, "duration_scalar_ns",
-                     "arrow::DurationScalar of value -100000ns")
-    check_stack_repr(gdb_arrow, "duration_scalar_null",
-                     "arrow::DurationScalar of null value [ns]")
-
-    check_stack_repr(
-        gdb_arrow, "timestamp_scalar_s",
-        "arrow::TimestampScalar of value 12345s [no timezone]")
-    check_stack_repr(
-        gdb_arrow, "timestamp_scalar_ms",
-        "arrow::TimestampScalar of value -123456ms [no timezone]")
-    check_stack_repr(
-        gdb_arrow, "timestamp_scalar_us",
-        "arrow::TimestampScalar of value 1234567us [no timezone]")
-    check_stack_repr(
-        gdb_arrow, "timestamp_scalar_ns",
-        "arrow::TimestampScalar of value -12345678ns [no timezone]")
-    check_stack_repr(
-        gdb_arrow, "timestamp_scalar_null",
-        "arrow::TimestampScalar of null value [ns, no timezone]")
-
-    check_stack_repr(
-        gdb_arrow, "timestamp_scalar_s_tz",
-        'arrow::TimestampScalar of value 12345s ["Europe/Paris"]')
-    check_stack_repr(
-        gdb_arrow, "timestamp_scalar_ms_tz",
-        'arrow::TimestampScalar of value -123456ms ["Europe/Paris"]')
-    check_stack_repr(
-        gdb_arrow, "timestamp_scalar_us_tz",
-        'arrow::TimestampScalar of value 1234567us ["Europe/Paris"]')
-    check_stack_repr(
-        gdb_arrow, "timestamp_scalar_ns_tz",
-        'arrow::TimestampScalar of value -12345678ns ["Europe/Paris"]')
-    check_stack_repr(
-        gdb_arrow, "timestamp_scalar_null_tz",
-        'arrow::TimestampScalar of null value [ns, "Europe/Paris"]')
-
-    check_stack_repr(gdb_arrow, "month_interval_scalar",
-                     "arrow::MonthIntervalScalar of value 23M")
-    check_stack_repr(gdb_arrow, "month_interval_scalar_null",
-                     "arrow::MonthIntervalScalar of null value")
-    check_stack_repr(gdb_arrow, "day_time_interval_scalar",
-                     "arrow::DayTimeIntervalScalar of value 23d-456ms")
-    check_stack_repr(gdb_arrow, "day_time_interval_scalar_null",
-                     "arrow::DayTimeIntervalScalar of null value")
-    check_stack_repr(
-        gdb_arrow, "month_day_nano_interval_scalar",
-        "arrow::MonthDayNanoIntervalScalar of value 1M23d-456ns")
-    check_stack_repr(
-        gdb_arrow, "month_day_nano_interval_scalar_null",
-        "arrow::MonthDayNanoIntervalScalar of null value")
-
-    check_stack_repr(gdb_arrow, "date32_scalar",
-                     "arrow::Date32Scalar of value 23d")
-    check_stack_repr(gdb_arrow, "date32_scalar_null",
-                     "arrow::Date32Scalar of null value")
-    check_stack_repr(gdb_arrow, "date64_scalar",
-                     "arrow::Date64Scalar of value 3870000000ms")
-    check_stack_repr(gdb_arrow, "date64_scalar_null",
-                     "arrow::Date64Scalar of null value")
-
-    check_stack_repr(
-        gdb_arrow, "decimal128_scalar_null",
-        "arrow::Decimal128Scalar of null value [precision=10, scale=4]")
-    check_stack_repr(
-        gdb_arrow, "decimal128_scalar_pos_scale_pos",
-        "arrow::Decimal128Scalar of value 123.4567 [precision=10, scale=4]")
-    check_stack_repr(
-        gdb_arrow, "decimal128_scalar_pos_scale_neg",
-        "arrow::Decimal128Scalar of value -123.4567 [precision=10, scale=4]")
-    check_stack_repr(
-        gdb_arrow, "decimal128_scalar_neg_scale_pos",
-        ("arrow::Decimal128Scalar of value 1.234567e+10 "
-         "[precision=10, scale=-4]"))
-    check_stack_repr(
-        gdb_arrow, "decimal128_scalar_neg_scale_neg",
-        ("arrow::Decimal128Scalar of value -1.234567e+10 "
-         "[precision=10, scale=-4]"))
-
-    check_stack_repr(
-        gdb_arrow, "decimal256_scalar_null",
-        "arrow::Decimal256Scalar of null value [precision=50, scale=4]")
-    check_stack_repr(
-        gdb_arrow, "decimal256_scalar_pos_scale_pos",
-        ("arrow::Decimal256Scalar of value "
-         "123456789012345678901234567890123456789012.3456 "
-         "[precision=50, scale=4]"))
-    check_stack_repr(
-        gdb_arrow, "decimal256_scalar_pos_scale_neg",
-        ("arrow::Decimal256Scalar of value "
-         "-123456789012345678901234567890123456789012.3456 "
-         "[precision=50, scale=4]"))
-    check_stack_repr(
-        gdb_arrow, "decimal256_scalar_neg_scale_pos",
-        ("arrow::Decimal256Scalar of value "
-         "1.234567890123456789012345678901234567890123456e+49 "
-         "[precision=50, scale=-4]"))
-    check_stack_repr(
-        gdb_arrow, "decimal256_scalar_neg_scale_neg",
-        ("arrow::Decimal256Scalar of value "
-         "-1.234567890123456789012345678901234567890123456e+49 "
-         "[precision=50, scale=-4]"))
-
-    check_stack_repr(
-        gdb_arrow, "binary_scalar_null",
-        "arrow::BinaryScalar of null value")
-    check_stack_repr(
-        gdb_arrow, "binary_scalar_unallocated",
-        "arrow::BinaryScalar of value <unallocated>")
-    check_stack_repr(
-        gdb_arrow, "binary_scalar_empty",
-        'arrow::BinaryScalar of size 0, value ""')
-    check_stack_repr(
-        gdb_arrow, "binary_scalar_abc",
-        'arrow::BinaryScalar of size 3, value "abc"')
-    check_stack_repr(
-        gdb_arrow, "binary_scalar_bytes",
-        r'arrow::BinaryScalar of size 3, value "\000\037\377"')
-    check_stack_repr(
-        gdb_arrow, "large_binary_scalar_abc",
-        'arrow::LargeBinaryScalar of size 3, value "abc"')
-
-    check_stack_repr(
-        gdb_arrow, "string_scalar_null",
-        "arrow::StringScalar of null value")
-    check_stack_repr(
-        gdb_arrow, "string_scalar_unallocated",
-        "arrow::StringScalar of value <unallocated>")
-    check_stack_repr(
-        gdb_arrow, "string_scalar_empty",
-        'arrow::StringScalar of size 0, value ""')
-    check_stack_repr(
-        gdb_arrow, "string_scalar_hehe",
-        'arrow::StringScalar of size 6, value "héhé"')
-    # FIXME: excessive escaping ('\\xff' vs. '\x00')
-    check_stack_repr(
-        gdb_arrow, "string_scalar_invalid_chars",
-        r'arrow::StringScalar of size 11, value "abc\x00def\\xffghi"')
-    check_stack_repr(
-        gdb_arrow, "large_string_scalar_hehe",
-        'arrow::LargeStringScalar of size 6, value "héhé"')
-
-    check_stack_repr(
-        gdb_arrow, "fixed_size_binary_scalar",
-        'arrow::FixedSizeBinaryScalar of size 3, value "abc"')
-    check_stack_repr(
-        gdb_arrow, "fixed_size_binary_scalar_null",
-        'arrow::FixedSizeBinaryScalar of size 3, null value')
-
-    check_stack_repr(
-        gdb_arrow, "dict_scalar",
-        re.compile(
-            (r'^arrow::DictionaryScalar of index '
-             r'arrow::Int8Scalar of value 42, '
-             r'dictionary arrow::StringArray ')))
-    check_stack_repr(
-        gdb_arrow, "dict_scalar_null",
-        ('arrow::DictionaryScalar of type '
-         'arrow::dictionary(arrow::int8(), arrow::utf8(), ordered=false), '
-         'null value'))
-
-    check_stack_repr(
-        gdb_arrow, "list_scalar",
-        ('arrow::ListScalar of value arrow::Int32Array of '
-         'length 3, null count 0'))
-    check_stack_repr(
-        gdb_arrow, "list_scalar_null",
-        'arrow::ListScalar of type arrow::list(arrow::int32()), null value')
-    check_stack_repr(
-        gdb_arrow, "large_list_scalar",
-        ('arrow::LargeListScalar of value arrow::Int32Array of '
-         'length 3, null count 0'))
-    check_stack_repr(
-        gdb_arrow, "large_list_scalar_null",
-        ('arrow::LargeListScalar of type arrow::large_list(arrow::int32()), '
-         'null value'))
-    check_stack_repr(
-        gdb_arrow, "fixed_size_list_scalar",
-        ('arrow::FixedSizeListScalar of value arrow::Int32Array of '
-         'length 3, null count 0'))
-    check_stack_repr(
-        gdb_arrow, "fixed_size_list_scalar_null",
-        ('arrow::FixedSizeListScalar of type '
-         'arrow::fixed_size_list(arrow::int32(), 3), null value'))
-
-    check_stack_repr(
-        gdb_arrow, "struct_scalar",
-        ('arrow::StructScalar = {["ints"] = arrow::Int32Scalar of value 42, '
-         '["strs"] = arrow::StringScalar of size 9, value "some text"}'))
-    check_stack_repr(
-        gdb_arrow, "struct_scalar_null",
-        ('arrow::StructScalar of type arrow::struct_('
-         '{arrow::field("ints", arrow::int32()), '
-         'arrow::field("strs", arrow::utf8())}), null value'))
-
-    check_stack_repr(
-        gdb_arrow, "sparse_union_scalar",
-        ('arrow::SparseUnionScalar of type code 7, '
-         'value arrow::Int32Scalar of value 43'))
-    check_stack_repr(
-        gdb_arrow, "sparse_union_scalar_null", re.compile(
-            r'^arrow::SparseUnionScalar of type arrow::sparse_union\(.*\), '
-            r'type code 7, null value$'))
-    check_stack_repr(
-        gdb_arrow, "dense_union_scalar",
-        ('arrow::DenseUnionScalar of type code 7, '
-         'value arrow::Int32Scalar of value 43'))
-    check_stack_repr(
-        gdb_arrow, "dense_union_scalar_null", re.compile(
-            r'^arrow::DenseUnionScalar of type arrow::dense_union\(.*\), '
-            r'type code 7, null value$'))
-
-    check_stack_repr(
-        gdb_arrow, "extension_scalar",
-        ('arrow::ExtensionScalar of type "extension<uuid>", '
-         'value arrow::FixedSizeBinaryScalar of size 16, '
-         'value "0123456789abcdef"'))
-    check_stack_repr(
-        gdb_arrow, "extension_scalar_null",
-        'arrow::ExtensionScalar of type "extension<uuid>", null value')
+    with batched_checks():
+        for expr, expected in SCALARS_STACK_CASES:
+            check_stack_repr(gdb_arrow, expr, expected)
+        for expr, pattern in SCALARS_STACK_RE_CASES:
+            check_stack_repr_re(gdb_arrow, expr, pattern)
 
 
 def test_scalars_heap(gdb_arrow):
-    check_heap_repr(gdb_arrow, "heap_null_scalar", "arrow::NullScalar")
-    check_heap_repr(gdb_arrow, "heap_bool_scalar",
-                    "arrow::BooleanScalar of value true")
-    check_heap_repr(
-        gdb_arrow, "heap_decimal128_scalar",
-        "arrow::Decimal128Scalar of value 123.4567 [precision=10, scale=4]")
-    check_heap_repr(
-        gdb_arrow, "heap_decimal256_scalar",
-        ("arrow::Decimal256Scalar of value "
-         "123456789012345678901234567890123456789012.3456 "
-         "[precision=50, scale=4]"))
-
-    check_heap_repr(
-        gdb_arrow, "heap_map_scalar",
-        ('arrow::MapScalar of type arrow::map(arrow::utf8(), arrow::int32(), '
-         'keys_sorted=false), value length 2, null count 0'))
-    check_heap_repr(
-        gdb_arrow, "heap_map_scalar_null",
-        ('arrow::MapScalar of type arrow::map(arrow::utf8(), arrow::int32(), '
-         'keys_sorted=false), null value'))
-
-
-def test_array_data(gdb_arrow):
-    check_stack_repr(
-        gdb_arrow, "int32_array_data",
-        "arrow::ArrayData of type arrow::int32(), length 4, null count 1")
-
-
-def test_arrays_stack(gdb_arrow):
-    check_stack_repr(
-        gdb_arrow, "int32_array",
-        "arrow::Int32Array of length 4, null count 1")
-    check_stack_repr(
-        gdb_arrow, "list_array",
-        ("arrow::ListArray of type arrow::list(arrow::int64()), "
-         "length 3, null count 1"))
-
-
-def test_arrays_heap(gdb_arrow):
-    check_heap_repr(
-        gdb_arrow, "heap_int32_array",
-        "arrow::Int32Array of length 4, null count 1")
-    check_heap_repr(
-        gdb_arrow, "heap_list_array",
-        ("arrow::ListArray of type arrow::list(arrow::int64()), "
-         "length 3, null count 1"))
-
-
-def test_schema(gdb_arrow):
-    check_heap_repr(gdb_arrow, "schema_empty",
-                    "arrow::Schema with 0 fields")
-    check_heap_repr(
-        gdb_arrow, "schema_non_empty",
-        ('arrow::Schema with 2 fields = {["ints"] = arrow::int8(), '
-         '["strs"] = arrow::utf8()}'))
-    check_heap_repr(
-        gdb_arrow, "schema_with_metadata",
-        ('arrow::Schema with 2 fields and 2 metadata items = '
-         '{["ints"] = arrow::int8(), ["strs"] = arrow::utf8()}'))
-
-
-def test_chunked_array(gdb_arrow):
-    check_stack_repr(
-        gdb_arrow, "chunked_array",
-        ("arrow::ChunkedArray of type arrow::int32(), length 5, null count 1 "
-         "with 2 chunks = {[0] = length 2, null count 0, "
-         "[1] = length 3, null count 1}"))
+    with batched_checks():
+        check_heap_repr(gdb_arrow, "heap_null_scalar", "arrow::NullScalar")
+        check_heap_repr(gdb_arrow, "heap_bool_scalar",
+                        "arrow::BooleanScalar of value true")
+        check_heap_repr(
+            gdb_arrow, "heap_decimal128_scalar",
+            ("arrow::Decimal128Scalar of value 123.4567 "
+             "[precision=10, scale=4]"))
+        check_heap_repr(
+            gdb_arrow, "heap_decimal256_scalar",
+            ("arrow::Decimal256Scalar of value "
+             "123456789012345678901234567890123456789012.3456 "
+             "[precision=50, scale=4]"))
+
+        check_heap_repr(
+            gdb_arrow, "heap_map_scalar",
+            ('arrow::MapScalar of type arrow::map(arrow::utf8(), '
+             'arrow::int32(), keys_sorted=false), value length 2, '
+             'null count 0'))
+        check_heap_repr(
+            gdb_arrow, "heap_map_scalar_null",
+            ('arrow::MapScalar of type arrow::map(arrow::utf8(), '
+             'arrow::int32(), keys_sorted=false), null value'))
+
+
+STACK_CASES = (
+    ("int32_array_data",
+     "arrow::ArrayData of type arrow::int32(), length 4, null count 1"),
+
+    ("int32_array", "arrow::Int32Array of length 4, null count 1"),
+    ("list_array",
+     ("arrow::ListArray of type arrow::list(arrow::int64()), "
+      "length 3, null count 1")),
+
+    ("chunked_array",
+     ("arrow::ChunkedArray of type arrow::int32(), length 5, null count 1 "
+      "with 2 chunks = {[0] = length 2, null count 0, "
+      "[1] = length 3, null count 1}")),
+
+    ("empty_datum", "arrow::Datum (empty)"),
+    ("scalar_datum",
+     "arrow::Datum of value arrow::BooleanScalar of null value"),
+)
+
+STACK_PREFIX_CASES = (
+    ("array_datum",
+     Prefix("arrow::Datum of value arrow::ArrayData of type ")),
+    ("chunked_array_datum",
+     Prefix("arrow::Datum of value arrow::ChunkedArray of type ")),
+    ("batch_datum",
+     Prefix("arrow::Datum of value arrow::RecordBatch "
+            "with 2 columns, 3 rows ")),
+    ("table_datum",
+     Prefix("arrow::Datum of value arrow::Table with 2 columns, 5 rows ")),
+)
+
+HEAP_CASES = (
+    ("heap_int32_array", "arrow::Int32Array of length 4, null count 1"),
+    ("heap_list_array",
+     ("arrow::ListArray of type arrow::list(arrow::int64()), "
+      "length 3, null count 1")),
+
+    ("schema_empty", "arrow::Schema with 0 fields"),
+    ("schema_non_empty",
+     ('arrow::Schema with 2 fields = {["ints"] = arrow::int8(), '
+      '["strs"] = arrow::utf8()}')),
+    ("schema_with_metadata",
+     ('arrow::Schema with 2 fields and 2 metadata items = '
+      '{["ints"] = arrow::int8(), ["strs"] = arrow::utf8()}')),
+)
+
+
+def test_stack_reprs(gdb_arrow):
+    with batched_checks():
+        for expr, expected in STACK_CASES:
+            check_stack_repr(gdb_arrow, expr, expected)
+        for expr, prefix in STACK_PREFIX_CASES:
+            check_stack_repr_prefix(gdb_arrow, expr, prefix)
+
+
+def test_heap_reprs(gdb_arrow):
+    with batched_checks():
+        for expr, expected in HEAP_CASES:
+            check_heap_repr(gdb_arrow, expr, expected)
+
+
+_BATCH_COLUMNS = (
+    '["ints"] = arrow::ArrayData of type arrow::int32(), '
+    'length 3, null count 0, '
+    '["strs"] = arrow::ArrayData of type arrow::utf8(), '
+    'length 3, null count 1}')
+
+_EXPECTED_BATCH = (
+    'arrow::RecordBatch with 2 columns, 3 rows = {' + _BATCH_COLUMNS)
+
+_EXPECTED_BATCH_WITH_METADATA = (
+    'arrow::RecordBatch with 2 columns, 3 rows, 3 metadata items = {' +
+    _BATCH_COLUMNS)
+
+_EXPECTED_TABLE = (
+    'arrow::Table with 2 columns, 5 rows = {'
+    '["ints"] = arrow::ChunkedArray of type arrow::int32(), '
+    'length 5, null count 0 with 2 chunks = '
+    '{[0] = length 3, null count 0, [1] = length 2, null count 0}, '
+    '["strs"] = arrow::ChunkedArray of type arrow::utf8(), '
+    'length 5, null count 1 with 3 chunks = '
+    '{[0] = length 2, null count 1, [1] = length 1, null count 0, '
+    '[2] = length 2, null count 0}}')
+
+# ChunkedArray columns only display their top-level statistics in
+# summary-only mode
+_EXPECTED_TABLE_SUMMARY = (
+    'arrow::Table with 2 columns, 5 rows = {'
+    '["ints"] = arrow::ChunkedArray of type arrow::int32(), '
+    'length 5, null count 0 with 2 chunks, '
+    '["strs"] = arrow::ChunkedArray of type arrow::utf8(), '
+    'length 5, null count 1 with 3 chunks}')
 
 
 def test_record_batch(gdb_arrow):
-    expected_batch = (
-        'arrow::RecordBatch with 2 columns, 3 rows = {'
-        '["ints"] = arrow::ArrayData of type arrow::int32(), '
-        'length 3, null count 0, '
-        '["strs"] = arrow::ArrayData of type arrow::utf8(), '
-        'length 3, null count 1}')
-
-    # Representations may differ between those two because of
-    # RecordBatch (base class) vs. SimpleRecordBatch (concrete class).
-    check_heap_repr(gdb_arrow, "batch", expected_batch)
-    check_heap_repr(gdb_arrow, "batch.get()", expected_batch)
-
-    expected_batch_with_metadata = (
-        'arrow::RecordBatch with 2 columns, 3 rows, 3 metadata items = {'
-        '["ints"] = arrow::ArrayData of type arrow::int32(), '
-        'length 3, null count 0, '
-        '["strs"] = arrow::ArrayData of type arrow::utf8(), '
-        'length 3, null count 1}')
-
-    check_heap_repr(gdb_arrow, "batch_with_metadata",
-                    expected_batch_with_metadata)
-
-
-def test_table(gdb_arrow):
-    expected_table = (
-        'arrow::Table with 2 columns, 5 rows = {'
-        '["ints"] = arrow::ChunkedArray of type arrow::int32(), '
-        'length 5, null count 0 with 2 chunks = '
-        '{[0] = length 3, null count 0, [1] = length 2, null count 0}, '
-        '["strs"] = arrow::ChunkedArray of type arrow::utf8(), '
-        'length 5, null count 1 with 3 chunks = '
-        '{[0] = length 2, null count 1, [1] = length 1, null count 0, '
-        '[2] = length 2, null count 0}}')
-
-    # Same as RecordBatch above (Table vs. SimpleTable)
-    check_heap_repr(gdb_arrow, "table", expected_table)
-    check_heap_repr(gdb_arrow, "table.get()", expected_table)
-
-
-def test_datum(gdb_arrow):
-    check_stack_repr(gdb_arrow, "empty_datum", "arrow::Datum (empty)")
-    check_stack_repr(
-        gdb_arrow, "scalar_datum",
-        "arrow::Datum of value arrow::BooleanScalar of null value")
-    check_stack_repr(
-        gdb_arrow, "array_datum",
-        re.compile(r"^arrow::Datum of value arrow::ArrayData of type "))
-    check_stack_repr(
-        gdb_arrow, "chunked_array_datum",
-        re.compile(r"^arrow::Datum of value arrow::ChunkedArray of type "))
-    check_stack_repr(
-        gdb_arrow, "batch_datum",
-        re.compile(r"^arrow::Datum of value arrow::RecordBatch "
-                   r"with 2 columns, 3 rows "))
-    check_stack_repr(
-        gdb_arrow, "table_datum",
-        re.compile(r"^arrow::Datum of value arrow::Table "
-                   r"with 2 columns, 5 rows "))
+    with batched_checks():
+        # Representations may differ between those two because of
+        # RecordBatch (base class) vs. SimpleRecordBatch (concrete class).
+        check_heap_repr(gdb_arrow, "batch", _EXPECTED_BATCH)
+        check_heap_repr(gdb_arrow, "batch.get()", _EXPECTED_BATCH)
+        check_heap_repr(gdb_arrow, "batch_with_metadata",
+                        _EXPECTED_BATCH_WITH_METADATA)
+
+
+def test_table_full(gdb_arrow):
+    with batched_checks():
+        # Same as RecordBatch above (Table vs. SimpleTable)
+        check_heap_repr(gdb_arrow, "table", _EXPECTED_TABLE)
+        check_heap_repr(gdb_arrow, "table.get()", _EXPECTED_TABLE)
+
+
+def test_table_summary(gdb_arrow_summary):
+    with batched_checks():
+        check_stack_repr(
+            gdb_arrow_summary, "chunked_array",
+            ("arrow::ChunkedArray of type arrow::int32(), "
+             "length 5, null count 1 with 2 chunks"))
+        check_heap_repr(gdb_arrow_summary, "table", _EXPECTED_TABLE_SUMMARY)
+        check_heap_repr(gdb_arrow_summary, "table.get()",
+                        _EXPECTED_TABLE_SUMMARY)